@@ -16,15 +16,6 @@ from credtools.credibleset import CredibleSet, combine_creds
 from credtools.locus import LocusSet, load_locus_set
 from credtools.meta import meta
 from credtools.qc import locus_qc
-from credtools.wrappers import (
-    run_abf,
-    run_carma,
-    run_finemap,
-    run_multisusie,
-    run_rsparsepro,
-    run_susie,
-    run_susiex,
-)
 
 logger = logging.getLogger("CREDTOOLS")
 
@@ -82,27 +73,26 @@ def fine_map(
     max_causal : int, optional
         Maximum number of causal variants, by default 1.
     """
-    tool_func_dict: Dict[str, Callable[..., Any]] = {
-        "abf": run_abf,
-        "carma": run_carma,
-        "finemap": run_finemap,
-        "rsparsepro": run_rsparsepro,
-        "susie": run_susie,
-        "multisusie": run_multisusie,
-        "susiex": run_susiex,
+    tool_attr_dict: Dict[str, str] = {
+        "abf": "run_abf",
+        "carma": "run_carma",
+        "finemap": "run_finemap",
+        "rsparsepro": "run_rsparsepro",
+        "susie": "run_susie",
+        "multisusie": "run_multisusie",
+        "susiex": "run_susiex",
     }
-    inspect_dict = {
-        "abf": set(inspect.signature(run_abf).parameters),
-        "carma": set(inspect.signature(run_carma).parameters),
-        "finemap": set(inspect.signature(run_finemap).parameters),
-        "rsparsepro": set(inspect.signature(run_rsparsepro).parameters),
-        "susie": set(inspect.signature(run_susie).parameters),
-        "multisusie": set(inspect.signature(run_multisusie).parameters),
-        "susiex": set(inspect.signature(run_susiex).parameters),
-    }
-    params_dict = {}
-    for t, args in inspect_dict.items():
-        params_dict[t] = {k: v for k, v in kwargs.items() if k in args}
+
+    def get_tool_func(name: str) -> Callable[..., Any]:
+        """Import and return the wrapper for the selected tool only."""
+        from credtools import wrappers
+
+        return getattr(wrappers, tool_attr_dict[name])
+
+    def get_tool_params(tool_func: Callable[..., Any]) -> Dict[str, Any]:
+        """Filter kwargs down to the parameters the wrapper accepts."""
+        accepted = set(inspect.signature(tool_func).parameters)
+        return {k: v for k, v in kwargs.items() if k in accepted}
     if strategy == "single_input":
         if locus_set.n_loci > 1:
             raise ValueError(
@@ -125,8 +115,9 @@ def fine_map(
                         "No significant SNPs found by COJO, using max_causal=1"
                     )
                     max_causal = 1
-            return tool_func_dict[tool](
-                locus_set.loci[0], max_causal=max_causal, **params_dict[tool]
+            tool_func = get_tool_func(tool)
+            return tool_func(
+                locus_set.loci[0], max_causal=max_causal, **get_tool_params(tool_func)
             )
         else:
             raise ValueError(f"Tool {tool} not supported for single-input strategy")
@@ -134,8 +125,9 @@ def fine_map(
         # if locus_set.n_loci < 2:
         #     raise ValueError("Locus set must contain at least two loci for multi-input strategy")
         if tool in ["multisusie", "susiex"]:
-            return tool_func_dict[tool](
-                locus_set, max_causal=max_causal, **params_dict[tool]
+            tool_func = get_tool_func(tool)
+            return tool_func(
+                locus_set, max_causal=max_causal, **get_tool_params(tool_func)
             )
         else:
             raise ValueError(f"Tool {tool} not supported for multi-input strategy")
@@ -143,11 +135,11 @@ def fine_map(
         # if locus_set.n_loci < 2:
         #     raise ValueError("Locus set must contain at least two loci for post-hoc combine strategy")
         if tool in ["abf", "carma", "finemap", "rsparsepro", "susie"]:
+            tool_func = get_tool_func(tool)
+            tool_params = get_tool_params(tool_func)
             all_creds = []
             for locus in locus_set.loci:
-                creds = tool_func_dict[tool](
-                    locus, max_causal=max_causal, **params_dict[tool]
-                )
+                creds = tool_func(locus, max_causal=max_causal, **tool_params)
                 all_creds.append(creds)
             return combine_creds(
                 all_creds,
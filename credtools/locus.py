@@ -336,6 +336,10 @@ def intersect_sumstat_ld(locus: Locus) -> Locus:
     3. Subsets both datasets to common variants
     4. Reorders data to maintain consistency
     5. Returns a new Locus object with intersected data
+
+    The input locus is never mutated, so callers do not need to pass a
+    copy. When the LD matrix and sumstats are already matched, the input
+    locus itself is returned.
     """
     if locus.ld is None:
         raise ValueError("LD matrix not found.")
@@ -343,9 +347,10 @@ def intersect_sumstat_ld(locus: Locus) -> Locus:
         logger.info("The LD matrix and sumstats file are matched.")
         return locus
     ldmap = locus.ld.map.copy()
-    r = locus.ld.r.copy()
-    sumstats = locus.sumstats.copy()
-    sumstats = sumstats.sort_values([ColName.CHR, ColName.BP], ignore_index=True)
+    # no upfront copies of the LD matrix or sumstats: slicing below always
+    # allocates new objects, so the input locus is never mutated
+    r = locus.ld.r
+    sumstats = locus.sumstats.sort_values([ColName.CHR, ColName.BP], ignore_index=True)
     intersec_sumstats = sumstats[
         sumstats[ColName.SNPID].isin(ldmap[ColName.SNPID])
     ].copy()
@@ -2,12 +2,15 @@
 
 import logging
 import os
-from multiprocessing import Pool
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
 import matplotlib.pyplot as plt
+import numba
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from rich.progress import (
     BarColumn,
     MofNCompleteColumn,
@@ -17,8 +20,15 @@ from rich.progress import (
     TimeRemainingColumn,
 )
 from scipy import stats
-from scipy.optimize import curve_fit, minimize_scalar
-from sklearn.mixture import GaussianMixture
+from scipy.linalg import eigh as sp_eigh
+from scipy.optimize import minimize_scalar
+from scipy.special import logsumexp
+from threadpoolctl import threadpool_limits
+
+try:
+    from scipy.optimize import elementwise as sp_elementwise
+except ImportError:  # scipy < 1.15
+    sp_elementwise = None  # type: ignore
 
 from credtools.constants import ColName
 from credtools.locus import Locus, LocusSet, intersect_sumstat_ld, load_locus_set
@@ -26,7 +36,60 @@ from credtools.locus import Locus, LocusSet, intersect_sumstat_ld, load_locus_se
 logger = logging.getLogger("QC")
 
 
-def get_eigen(ldmatrix: np.ndarray) -> Dict[str, np.ndarray]:
+@numba.jit(nopython=True, cache=True)
+def _fit_mixture_weights(
+    log_lik: np.ndarray, max_iter: int = 1000, tol: float = 1e-6
+) -> np.ndarray:
+    """
+    Estimate mixture weights by EM with fixed components.
+
+    Each column of log_lik is the per-observation log-density of one
+    mixture component; only the weights are free. The E-step computes
+    responsibilities with a stable softmax, the M-step averages them.
+
+    Parameters
+    ----------
+    log_lik : np.ndarray
+        (n, k) matrix of per-component log-densities.
+    max_iter : int, optional
+        Maximum number of EM iterations, by default 1000.
+    tol : float, optional
+        Convergence threshold on max absolute weight change, by default 1e-6.
+
+    Returns
+    -------
+    np.ndarray
+        Estimated mixture weights of length k.
+    """
+    n, k = log_lik.shape
+    w = np.full(k, 1.0 / k)
+    for _ in range(max_iter):
+        logw = np.log(w + 1e-15)
+        w_new = np.zeros(k)
+        for i in range(n):
+            vmax = -np.inf
+            for j in range(k):
+                v = log_lik[i, j] + logw[j]
+                if v > vmax:
+                    vmax = v
+            ssum = 0.0
+            for j in range(k):
+                ssum += np.exp(log_lik[i, j] + logw[j] - vmax)
+            for j in range(k):
+                w_new[j] += np.exp(log_lik[i, j] + logw[j] - vmax) / ssum
+        w_new /= n
+        delta = 0.0
+        for j in range(k):
+            diff = abs(w_new[j] - w[j])
+            if diff > delta:
+                delta = diff
+        w = w_new
+        if delta < tol:
+            break
+    return w
+
+
+def get_eigen(ldmatrix: np.ndarray, overwrite_a: bool = False) -> Dict[str, np.ndarray]:
     """
     Compute eigenvalues and eigenvectors of LD matrix.
 
@@ -34,6 +97,10 @@ def get_eigen(ldmatrix: np.ndarray) -> Dict[str, np.ndarray]:
     ----------
     ldmatrix : np.ndarray
         A p by p symmetric, positive semidefinite correlation matrix.
+    overwrite_a : bool, optional
+        Allow LAPACK to destroy the input matrix, saving a p x p copy,
+        by default False. Only set this when the caller no longer needs
+        the LD matrix.
 
     Returns
     -------
@@ -44,21 +111,97 @@ def get_eigen(ldmatrix: np.ndarray) -> Dict[str, np.ndarray]:
 
     Notes
     -----
-    TODO: accelerate with joblib for large matrices.
-
-    This function uses numpy.linalg.eigh which is optimized for symmetric matrices
-    and returns eigenvalues in ascending order.
+    This function uses scipy.linalg.eigh with the 'evr' (Relatively Robust
+    Representations) driver, which is typically faster than the default
+    divide-and-conquer driver for dense symmetric eigenproblems, and skips
+    the finiteness check on the input. Eigenvalues are returned in
+    ascending order.
+
+    The decomposition runs in single precision: downstream consumers
+    (tolerance checks against r_tol, normal log-densities and the bounded
+    scalar optimizer) do not need FP64, while ssyevr has roughly twice the
+    throughput of dsyevr and halves the memory traffic of the p x p
+    eigenvector matrix.
     """
-    # ldmatrix = ldmatrix.astype(np.float32)
-    eigvals, eigvecs = np.linalg.eigh(ldmatrix)
+    ldmatrix = np.asarray(ldmatrix, dtype=np.float32, order="C")
+    eigvals, eigvecs = sp_eigh(
+        ldmatrix, driver="evr", overwrite_a=overwrite_a, check_finite=False
+    )
     return {"eigvals": eigvals, "eigvecs": eigvecs}
 
 
+@dataclass
+class _PreparedLocus:
+    """
+    Intersected locus data shared across the per-locus QC steps.
+
+    Attributes
+    ----------
+    locus : Locus
+        Locus with sumstats and LD matrix already intersected.
+    z_raw : np.ndarray
+        Raw z-scores (BETA / SE) with NaN replaced by 0.
+    sigma2 : np.ndarray
+        Per-variant shrinkage factor (n-1) / (z^2 + n-2).
+    z_transformed : np.ndarray
+        Transformed z-scores sqrt(sigma2) * z_raw.
+    eigens : Dict[str, np.ndarray]
+        Eigendecomposition of the LD matrix from get_eigen.
+    """
+
+    locus: Locus
+    z_raw: np.ndarray
+    sigma2: np.ndarray
+    z_transformed: np.ndarray
+    eigens: Dict[str, np.ndarray]
+
+
+def _prepare_locus(
+    locus: Locus, eigens: Optional[Dict[str, np.ndarray]] = None
+) -> _PreparedLocus:
+    """
+    Intersect sumstats with LD once and precompute quantities shared by QC steps.
+
+    Parameters
+    ----------
+    locus : Locus
+        Locus object containing summary statistics and LD matrix.
+    eigens : Optional[Dict[str, np.ndarray]], optional
+        Pre-computed eigendecomposition of the intersected LD matrix, by default None.
+        If None, it is computed here.
+
+    Returns
+    -------
+    _PreparedLocus
+        Bundle of intersected locus, z-scores and eigendecomposition.
+
+    Raises
+    ------
+    ValueError
+        If the locus sample size is <= 1.
+    """
+    input_locus = intersect_sumstat_ld(locus)
+    n = input_locus.sample_size
+    if n <= 1:
+        raise ValueError("n must be greater than 1")
+    z_raw = (
+        input_locus.sumstats[ColName.BETA] / input_locus.sumstats[ColName.SE]
+    ).to_numpy()
+    z_raw = np.where(np.isnan(z_raw), 0, z_raw)
+    sigma2 = (n - 1) / (z_raw**2 + n - 2)
+    # single precision to match the FP32 eigendecomposition from get_eigen
+    z_transformed = (np.sqrt(sigma2) * z_raw).astype(np.float32)
+    if eigens is None:
+        eigens = get_eigen(input_locus.ld.r)
+    return _PreparedLocus(input_locus, z_raw, sigma2, z_transformed, eigens)
+
+
 def estimate_s_rss(
     locus: Locus,
     r_tol: float = 1e-8,
     method: str = "null-mle",
     eigvens: Optional[Dict[str, np.ndarray]] = None,
+    prepared: Optional[_PreparedLocus] = None,
 ) -> float:
     """
     Estimate s parameter in the susie_rss Model Using Regularized LD.
@@ -74,6 +217,10 @@ def estimate_s_rss(
         Options: "null-mle", "null-partialmle", or "null-pseudomle".
     eigvens : Optional[Dict[str, np.ndarray]], optional
         Pre-computed eigenvalues and eigenvectors, by default None.
+    prepared : Optional[_PreparedLocus], optional
+        Pre-intersected locus data from _prepare_locus, by default None.
+        When provided, the intersection, z-score transform and
+        eigendecomposition are reused instead of recomputed.
 
     Returns
     -------
@@ -102,32 +249,16 @@ def estimate_s_rss(
     where sigma2 = (n-1) / (z^2 + n-2)
     """
     # make sure the LD matrix and sumstats file are matched
-    input_locus = locus.copy()
-    input_locus = intersect_sumstat_ld(input_locus)
-    z = (
-        input_locus.sumstats[ColName.BETA] / input_locus.sumstats[ColName.SE]
-    ).to_numpy()
-    n = input_locus.sample_size
-    # Check and process input arguments z, R
-    z = np.where(np.isnan(z), 0, z)
-    if eigvens is not None:
-        eigvals = eigvens["eigvals"]
-        eigvecs = eigvens["eigvecs"]
-    else:
-        eigens = get_eigen(input_locus.ld.r)
-        eigvals = eigens["eigvals"]
-        eigvecs = eigens["eigvecs"]
+    if prepared is None:
+        prepared = _prepare_locus(locus, eigens=eigvens)
+    z = prepared.z_transformed
+    eigvals = prepared.eigens["eigvals"]
+    eigvecs = prepared.eigens["eigvecs"]
 
     # if np.any(eigvals < -r_tol):
     #     logger.warning("The LD matrix is not positive semidefinite. Negative eigenvalues are set to zero")
     eigvals[eigvals < r_tol] = 0
 
-    if n <= 1:
-        raise ValueError("n must be greater than 1")
-
-    sigma2 = (n - 1) / (z**2 + n - 2)
-    z = np.sqrt(sigma2) * z
-
     if method == "null-mle":
 
         def negloglikelihood(s, ztv, d):
@@ -136,12 +267,14 @@ def estimate_s_rss(
             term2 = 0.5 * np.sum((ztv / denom) * ztv)
             return term1 + term2
 
-        ztv = eigvecs.T @ z
+        # accumulate the objective in float64 so the optimizer's sqrt(eps)
+        # tolerance remains attainable from the FP32 eigendecomposition
+        ztv = (eigvecs.T @ z).astype(np.float64)
         result = minimize_scalar(
             negloglikelihood,
             bounds=(0, 1),
             method="bounded",
-            args=(ztv, eigvals),
+            args=(ztv, eigvals.astype(np.float64)),
             options={"xatol": np.sqrt(np.finfo(float).eps)},
         )
         s = result.x  # type: ignore
@@ -159,12 +292,11 @@ def estimate_s_rss(
         def pseudolikelihood(
             s: float, z: np.ndarray, eigvals: np.ndarray, eigvecs: np.ndarray
         ) -> float:
-            precision = eigvecs @ (eigvecs.T / ((1 - s) * eigvals + s))
-            postmean = np.zeros_like(z)
-            postvar = np.zeros_like(z)
-            for i in range(len(z)):
-                postmean[i] = -(1 / precision[i, i]) * precision[i, :].dot(z) + z[i]
-                postvar[i] = 1 / precision[i, i]
+            dinv = 1 / ((1 - s) * eigvals + s)
+            diag = (eigvecs**2) @ dinv
+            pz = eigvecs @ (dinv * (eigvecs.T @ z))
+            postmean = z - pz / diag
+            postvar = 1 / diag
             return -np.sum(stats.norm.logpdf(z, loc=postmean, scale=np.sqrt(postvar)))
 
         result = minimize_scalar(
@@ -181,11 +313,105 @@ def estimate_s_rss(
     return s  # type: ignore
 
 
+def _estimate_s_rss_batch(
+    loci: List[Locus],
+    prepared_loci: List[_PreparedLocus],
+    r_tol: float = 1e-8,
+) -> List[float]:
+    """
+    Estimate s under "null-mle" for several loci in one vectorized pass.
+
+    Once ztv and the eigenvalues are precomputed, each objective
+    evaluation is cheap and the bounded scalar minimization is dominated
+    by per-iteration Python overhead. Loci are bucketed by variant count
+    so each bucket stacks into a rectangular array, then the minimization
+    runs elementwise across the bucket via scipy.optimize.elementwise.
+
+    Parameters
+    ----------
+    loci : List[Locus]
+        Loci to estimate s for, aligned with prepared_loci.
+    prepared_loci : List[_PreparedLocus]
+        Pre-intersected locus data from _prepare_locus.
+    r_tol : float, optional
+        Tolerance level for eigenvalue check of positive semidefinite matrix, by default 1e-8.
+
+    Returns
+    -------
+    List[float]
+        Estimated s values, one per locus.
+
+    Notes
+    -----
+    Falls back to per-locus estimate_s_rss when the vectorized minimizer
+    is unavailable (scipy < 1.15) or when a bucket entry fails to converge.
+    """
+    if sp_elementwise is None:
+        return [
+            estimate_s_rss(locus, r_tol, "null-mle", prepared=prepared)
+            for locus, prepared in zip(loci, prepared_loci)
+        ]
+
+    ztv2_list = []
+    for prepared in prepared_loci:
+        eigvals = prepared.eigens["eigvals"]
+        eigvals[eigvals < r_tol] = 0
+        ztv = (prepared.eigens["eigvecs"].T @ prepared.z_transformed).astype(np.float64)
+        ztv2_list.append(ztv**2)
+
+    # bucket loci by dimension so each bucket stacks into a rectangular array
+    buckets: Dict[int, List[int]] = {}
+    for idx, ztv2 in enumerate(ztv2_list):
+        buckets.setdefault(len(ztv2), []).append(idx)
+
+    svals = np.empty(len(prepared_loci))
+    xatol = np.sqrt(np.finfo(float).eps)
+    for indices in buckets.values():
+        ztv2 = np.stack([ztv2_list[i] for i in indices])
+        d = np.stack(
+            [prepared_loci[i].eigens["eigvals"].astype(np.float64) for i in indices]
+        )
+
+        def negloglikelihood(s: Any, idx: Any) -> np.ndarray:
+            rows = np.asarray(idx, dtype=int)
+            s = np.asarray(s)[..., np.newaxis]
+            denom = (1 - s) * d[rows] + s
+            return 0.5 * np.sum(np.log(denom) + ztv2[rows] / denom, axis=-1)
+
+        # the extra args must broadcast with s, so the stacked rows are
+        # addressed through an index array rather than passed directly
+        rows = np.arange(len(indices))
+        bracket = sp_elementwise.bracket_minimum(
+            negloglikelihood,
+            np.full(len(indices), 0.5),
+            xmin=xatol,
+            xmax=1 - xatol,
+            args=(rows,),
+        )
+        result = sp_elementwise.find_minimum(
+            negloglikelihood,
+            bracket.bracket,
+            args=(rows,),
+            tolerances={"xatol": xatol},
+        )
+        x = np.atleast_1d(result.x)
+        converged = np.atleast_1d(result.success)
+        for j, i in enumerate(indices):
+            if converged[j]:
+                svals[i] = x[j]
+            else:
+                svals[i] = estimate_s_rss(
+                    loci[i], r_tol, "null-mle", prepared=prepared_loci[i]
+                )
+    return svals.tolist()
+
+
 def kriging_rss(
     locus: Locus,
     r_tol: float = 1e-8,
     s: Optional[float] = None,
     eigvens: Optional[Dict[str, np.ndarray]] = None,
+    prepared: Optional[_PreparedLocus] = None,
 ) -> pd.DataFrame:
     """
     Compute distribution of z-scores of variant j given other z-scores, and detect possible allele switch issues.
@@ -201,6 +427,10 @@ def kriging_rss(
         If None, s will be estimated automatically.
     eigvens : Optional[Dict[str, np.ndarray]], optional
         Pre-computed eigenvalues and eigenvectors, by default None.
+    prepared : Optional[_PreparedLocus], optional
+        Pre-intersected locus data from _prepare_locus, by default None.
+        When provided, the intersection, z-score transform and
+        eigendecomposition are reused instead of recomputed.
 
     Returns
     -------
@@ -232,49 +462,29 @@ def kriging_rss(
 
     The algorithm:
     1. Computes conditional means and variances for each variant
-    2. Fits a Gaussian mixture model to capture heterogeneity
+    2. Estimates the weights of a scale mixture of normals over the a-grid
+       by maximizing the mixture likelihood of the observed z-scores
     3. Calculates likelihood ratios for allele switch detection
     """
     # Check and process input arguments z, R
-    input_locus = locus.copy()
-    input_locus = intersect_sumstat_ld(input_locus)
-    z = (
-        input_locus.sumstats[ColName.BETA] / input_locus.sumstats[ColName.SE]
-    ).to_numpy()
-    n = input_locus.sample_size
-    z = np.where(np.isnan(z), 0, z)
-
-    # Compute eigenvalues and eigenvectors
-    if eigvens is not None:
-        eigvals = eigvens["eigvals"]
-        eigvecs = eigvens["eigvecs"]
-    else:
-        eigens = get_eigen(input_locus.ld.r)
-        eigvals = eigens["eigvals"]
-        eigvecs = eigens["eigvecs"]
+    if prepared is None:
+        prepared = _prepare_locus(locus, eigens=eigvens)
+    input_locus = prepared.locus
+    z = prepared.z_transformed
+    eigvals = prepared.eigens["eigvals"]
+    eigvecs = prepared.eigens["eigvecs"]
     if s is None:
-        s = estimate_s_rss(locus, eigvens={"eigvals": eigvals, "eigvecs": eigvecs})
+        s = estimate_s_rss(locus, prepared=prepared)
     eigvals = eigvals[::-1]
     eigvecs = eigvecs[:, ::-1]
 
     eigvals[eigvals < r_tol] = 0
 
-    if n <= 1:
-        raise ValueError("n must be greater than 1")
-
-    sigma2 = (n - 1) / (z**2 + n - 2)
-    z = np.sqrt(sigma2) * z
-
     dinv = 1 / ((1 - s) * eigvals + s)
     dinv[np.isinf(dinv)] = 0
-    precision = eigvecs @ (eigvecs * dinv).T
-    condmean = np.zeros_like(z)
-    condvar = np.zeros_like(z)
-    for i in range(len(z)):
-        condmean[i] = -(1 / precision[i, i]) * precision[i, :i].dot(z[:i]) - (
-            1 / precision[i, i]
-        ) * precision[i, i + 1 :].dot(z[i + 1 :])
-        condvar[i] = 1 / precision[i, i]
+    diag, pz = _fused_cond_moments(eigvecs, dinv, z)
+    condmean = z - pz / diag
+    condvar = 1 / diag
     z_std_diff = (z - condmean) / np.sqrt(condvar)
 
     # Obtain grid
@@ -287,29 +497,27 @@ def kriging_rss(
 
     # Compute likelihood
     sd_mtx = np.outer(np.sqrt(condvar), a_grid)
-    matrix_llik = stats.norm.logpdf(
-        z[:, np.newaxis] - condmean[:, np.newaxis], scale=sd_mtx
-    )
-    lfactors = np.max(matrix_llik, axis=1)
-    matrix_llik = matrix_llik - lfactors[:, np.newaxis]
+    # inlined normal log-density: both likelihood passes share the same
+    # scale matrix, so its log and reciprocal are computed only once
+    inv_sd = 1.0 / sd_mtx
+    log_sd = np.log(sd_mtx)
 
-    # Estimate weight using Gaussian Mixture Model
-    gmm = GaussianMixture(
-        n_components=len(a_grid), covariance_type="diag", max_iter=1000
-    )
-    gmm.fit(matrix_llik)
-    w = gmm.weights_
+    def lognormpdf(x: np.ndarray) -> np.ndarray:
+        xs = x * inv_sd
+        return -0.5 * (xs * xs) - log_sd - 0.5 * np.log(2 * np.pi)
+
+    matrix_llik = lognormpdf(z[:, np.newaxis] - condmean[:, np.newaxis])
+
+    # Estimate a-grid mixture weights with a weight-only EM; matrix_llik
+    # already holds the per-component log-densities
+    w = _fit_mixture_weights(np.ascontiguousarray(matrix_llik, dtype=np.float64))
 
     # Compute denominators in likelihood ratios
-    logl0mix = np.log(np.sum(np.exp(matrix_llik) * (w + 1e-15), axis=1)) + lfactors  # type: ignore
+    logl0mix = logsumexp(matrix_llik, b=w + 1e-15, axis=1)
 
     # Compute numerators in likelihood ratios
-    matrix_llik = stats.norm.logpdf(
-        z[:, np.newaxis] + condmean[:, np.newaxis], scale=sd_mtx
-    )
-    lfactors = np.max(matrix_llik, axis=1)
-    matrix_llik = matrix_llik - lfactors[:, np.newaxis]
-    logl1mix = np.log(np.sum(np.exp(matrix_llik) * (w + 1e-15), axis=1)) + lfactors  # type: ignore
+    matrix_llik = lognormpdf(z[:, np.newaxis] + condmean[:, np.newaxis])
+    logl1mix = logsumexp(matrix_llik, b=w + 1e-15, axis=1)
 
     # Compute (log) likelihood ratios
     logLRmix = logl1mix - logl0mix
@@ -330,7 +538,9 @@ def kriging_rss(
     return res
 
 
-def compute_dentist_s(locus: Locus) -> pd.DataFrame:
+def compute_dentist_s(
+    locus: Locus, prepared: Optional[_PreparedLocus] = None
+) -> pd.DataFrame:
     """
     Compute Dentist-S statistic and p-value for outlier detection.
 
@@ -338,6 +548,9 @@ def compute_dentist_s(locus: Locus) -> pd.DataFrame:
     ----------
     locus : Locus
         Locus object containing summary statistics and LD matrix.
+    prepared : Optional[_PreparedLocus], optional
+        Pre-intersected locus data from _prepare_locus, by default None.
+        When provided, the intersection is reused instead of recomputed.
 
     Returns
     -------
@@ -364,27 +577,34 @@ def compute_dentist_s(locus: Locus) -> pd.DataFrame:
     TODO: Use ABF to select lead variant, although in most cases the lead variant
     is the one with the smallest p-value.
     """
-    input_locus = locus.copy()
-    input_locus = intersect_sumstat_ld(input_locus)
-    df = input_locus.sumstats.copy()
-    df["Z"] = df[ColName.BETA] / df[ColName.SE]
-    lead_idx = df[ColName.P].idxmin()
+    if prepared is not None:
+        input_locus = prepared.locus
+    else:
+        input_locus = intersect_sumstat_ld(locus)
+    sumstats = input_locus.sumstats
+    z = sumstats[ColName.BETA].to_numpy() / sumstats[ColName.SE].to_numpy()
+    lead_idx = int(np.argmin(sumstats[ColName.P].to_numpy()))
     # TODO: use abf to select lead variant, although in most cases the lead variant is the one with the smallest p-value
-    lead_z = df.loc[lead_idx, "Z"]
-    df["r"] = input_locus.ld.r[lead_idx]
+    r = input_locus.ld.r[lead_idx]
 
-    df["t_dentist_s"] = (df["Z"] - df["r"] * lead_z) ** 2 / (1 - df["r"] ** 2)  # type: ignore
-    df["t_dentist_s"] = np.where(df["t_dentist_s"] < 0, np.inf, df["t_dentist_s"])
-    df.at[lead_idx, "t_dentist_s"] = np.nan
-    df["p_dentist_s"] = stats.chi2.logsf(df["t_dentist_s"], df=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_dentist_s = (z - r * z[lead_idx]) ** 2 / (1 - r * r)
+    # single-pass masked writes instead of an np.where blend plus a
+    # pandas .at locator for the lead variant
+    t_dentist_s[t_dentist_s < 0] = np.inf
+    t_dentist_s[lead_idx] = np.nan
+    p_dentist_s = stats.chi2.logsf(t_dentist_s, df=1)
 
-    df = df[[ColName.SNPID, "t_dentist_s", "p_dentist_s"]].copy()
-    # df.set_index(ColName.SNPID, inplace=True)
-    # df.index.name = None
-    return df
+    return pd.DataFrame(
+        {
+            ColName.SNPID: sumstats[ColName.SNPID].to_numpy(),
+            "t_dentist_s": t_dentist_s,
+            "p_dentist_s": p_dentist_s,
+        }
+    )
 
 
-def compare_maf(locus: Locus) -> pd.DataFrame:
+def compare_maf(locus: Locus, prepared: Optional[_PreparedLocus] = None) -> pd.DataFrame:
     """
     Compare allele frequencies between summary statistics and LD reference.
 
@@ -392,6 +612,9 @@ def compare_maf(locus: Locus) -> pd.DataFrame:
     ----------
     locus : Locus
         Locus object containing summary statistics and LD matrix.
+    prepared : Optional[_PreparedLocus], optional
+        Pre-intersected locus data from _prepare_locus, by default None.
+        When provided, the intersection is reused instead of recomputed.
 
     Returns
     -------
@@ -421,11 +644,16 @@ def compare_maf(locus: Locus) -> pd.DataFrame:
 
     MAF is calculated as min(AF, 1-AF) for both sources.
     """
-    input_locus = locus.copy()
-    if "AF2" not in input_locus.ld.map.columns:
-        logger.warning("AF2 is not in the LD matrix.")
-        return pd.DataFrame()
-    input_locus = intersect_sumstat_ld(input_locus)
+    if prepared is not None:
+        input_locus = prepared.locus
+        if "AF2" not in input_locus.ld.map.columns:
+            logger.warning("AF2 is not in the LD matrix.")
+            return pd.DataFrame()
+    else:
+        if "AF2" not in locus.ld.map.columns:
+            logger.warning("AF2 is not in the LD matrix.")
+            return pd.DataFrame()
+        input_locus = intersect_sumstat_ld(locus)
     df = input_locus.sumstats[[ColName.SNPID, ColName.MAF]].copy()
     df.rename(columns={ColName.MAF: "MAF_sumstats"}, inplace=True)
     df.set_index(ColName.SNPID, inplace=True)
@@ -538,8 +766,11 @@ def ld_4th_moment(locus_set: LocusSet) -> pd.DataFrame:
             locus.sumstats[ColName.SNPID].isin(overlap_snps)
         ]
         locus = intersect_sumstat_ld(locus)
+        # einsum fuses the squaring and column sum, so only one p x p
+        # temporary is formed instead of materializing the full r^4 matrix
+        r2 = locus.ld.r * locus.ld.r
         r_4th = pd.Series(
-            index=locus.ld.map[ColName.SNPID], data=np.power(locus.ld.r, 4).sum(axis=0)
+            index=locus.ld.map[ColName.SNPID], data=np.einsum("ij,ij->j", r2, r2)
         )
         r_4th = r_4th - 1
         r_4th.name = f"{locus.popu}_{locus.cohort}"
@@ -547,6 +778,196 @@ def ld_4th_moment(locus_set: LocusSet) -> pd.DataFrame:
     return pd.concat(ld_4th_res, axis=1)
 
 
+@numba.jit(nopython=True, parallel=True, fastmath=True, cache=True)
+def _fused_cond_moments(
+    eigvecs: np.ndarray, dinv: np.ndarray, z: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute diag(P) and P @ z from the eigendecomposition in one fused pass.
+
+    With P = eigvecs @ diag(dinv) @ eigvecs.T, computes
+    diag_i = sum_k V_ik^2 * dinv_k and pz_i = sum_k V_ik * dinv_k * ztv_k
+    where ztv = eigvecs.T @ z. After the initial ztv sweep, each row of
+    eigvecs is loaded exactly once and feeds both outputs, halving the
+    bytes moved versus two separate matrix products on large p.
+
+    Parameters
+    ----------
+    eigvecs : np.ndarray
+        p x p eigenvector matrix.
+    dinv : np.ndarray
+        Inverse regularized eigenvalues of length p.
+    z : np.ndarray
+        z-score vector of length p.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        diag(P) and P @ z, both of length p.
+    """
+    p, m = eigvecs.shape
+    ztv = np.zeros(m, dtype=np.float64)
+    for i in range(p):
+        zi = z[i]
+        for k in range(m):
+            ztv[k] += eigvecs[i, k] * zi
+    dztv = dinv.astype(np.float64) * ztv
+    diag = np.empty(p, dtype=np.float64)
+    pz = np.empty(p, dtype=np.float64)
+    for i in numba.prange(p):
+        acc_diag = 0.0
+        acc_pz = 0.0
+        for k in range(m):
+            v = eigvecs[i, k]
+            acc_diag += v * v * dinv[k]
+            acc_pz += v * dztv[k]
+        diag[i] = acc_diag
+        pz[i] = acc_pz
+    return diag, pz
+
+
+@numba.jit(nopython=True, cache=True)
+def _exp_fit_sse(r2_avg: np.ndarray, a: float, b: float) -> float:
+    """Sum of squared residuals of the a * exp(-b * x) decay model."""
+    sse = 0.0
+    for k in range(len(r2_avg)):
+        arg = -b * float(k + 1)
+        if arg > 700.0:
+            arg = 700.0
+        resid = r2_avg[k] - a * np.exp(arg)
+        sse += resid * resid
+    return sse
+
+
+@numba.jit(nopython=True, cache=True)
+def _ld_decay_core(
+    bp: np.ndarray, r: np.ndarray, nbins: int, binsize: int
+) -> Tuple[np.ndarray, float]:
+    """
+    Bin pairwise r^2 by distance and fit an exponential decay model.
+
+    Accumulates the lower triangle of the LD matrix into equal-width
+    distance bins without materializing the pairwise distance arrays,
+    then fits r^2 = a * exp(-b * x) to the bin averages with a damped
+    Gauss-Newton iteration.
+
+    Parameters
+    ----------
+    bp : np.ndarray
+        Base-pair positions of the variants.
+    r : np.ndarray
+        p x p LD correlation matrix.
+    nbins : int
+        Number of distance bins.
+    binsize : int
+        Width of each distance bin in base pairs.
+
+    Returns
+    -------
+    Tuple[np.ndarray, float]
+        Average r^2 per distance bin and the fitted amplitude parameter.
+    """
+    p = len(bp)
+    r_sum = np.zeros(nbins)
+    count = np.zeros(nbins, dtype=np.int64)
+    for i in range(1, p):
+        for j in range(i):
+            d = bp[i] - bp[j]
+            if d < 0:
+                d = -d
+            idx = d // binsize
+            if idx > nbins - 1:
+                idx = nbins - 1
+            val = r[i, j]
+            r_sum[idx] += val * val
+            count[idx] += 1
+    r2_avg = np.zeros(nbins)
+    for k in range(nbins):
+        if count[k] > 0:
+            r2_avg[k] = r_sum[k] / count[k]
+
+    # initialize a * exp(-b * x) from a log-linear fit on the non-empty
+    # bins (log y = log a - b x, weighted by y so the noisy near-zero
+    # tail does not dominate), then refine with damped Gauss-Newton
+    a = 1.0
+    b = 1.0
+    n_pos = 0
+    sw = 0.0
+    swx = 0.0
+    swy = 0.0
+    swxx = 0.0
+    swxy = 0.0
+    for k in range(nbins):
+        if r2_avg[k] > 0:
+            w = r2_avg[k]
+            x = float(k + 1)
+            y = np.log(r2_avg[k])
+            sw += w
+            swx += w * x
+            swy += w * y
+            swxx += w * x * x
+            swxy += w * x * y
+            n_pos += 1
+    if n_pos >= 2:
+        denom = sw * swxx - swx * swx
+        if denom != 0.0:
+            slope = (sw * swxy - swx * swy) / denom
+            a = np.exp((swy - slope * swx) / sw)
+            b = -slope
+
+    sse = _exp_fit_sse(r2_avg, a, b)
+    for _ in range(10):
+        # Jacobian columns of a*exp(-b*x) are exp(-b*x) and -a*x*exp(-b*x)
+        jtj00 = 0.0
+        jtj01 = 0.0
+        jtj11 = 0.0
+        jtr0 = 0.0
+        jtr1 = 0.0
+        for k in range(nbins):
+            x = float(k + 1)
+            arg = -b * x
+            if arg > 700.0:
+                arg = 700.0
+            e = np.exp(arg)
+            resid = r2_avg[k] - a * e
+            j0 = e
+            j1 = -a * x * e
+            jtj00 += j0 * j0
+            jtj01 += j0 * j1
+            jtj11 += j1 * j1
+            jtr0 += j0 * resid
+            jtr1 += j1 * resid
+        det = jtj00 * jtj11 - jtj01 * jtj01
+        if det == 0.0:
+            break
+        da = (jtj11 * jtr0 - jtj01 * jtr1) / det
+        db = (jtj00 * jtr1 - jtj01 * jtr0) / det
+        if not (np.isfinite(da) and np.isfinite(db)):
+            break
+        # halve the step until the sum of squares improves
+        step = 1.0
+        improved = False
+        a_new = a
+        b_new = b
+        sse_new = sse
+        for _half in range(10):
+            a_new = a + step * da
+            b_new = b + step * db
+            sse_new = _exp_fit_sse(r2_avg, a_new, b_new)
+            if sse_new < sse:
+                improved = True
+                break
+            step *= 0.5
+        if not improved:
+            break
+        a = a_new
+        b = b_new
+        sse = sse_new
+        if abs(step * da) < 1e-10 and abs(step * db) < 1e-10:
+            break
+    return r2_avg, a
+
+
 def ld_decay(locus_set: LocusSet) -> pd.DataFrame:
     """
     Compute LD decay patterns across cohorts.
@@ -584,36 +1005,19 @@ def ld_decay(locus_set: LocusSet) -> pd.DataFrame:
     - Admixture patterns
     - Founder effects
     """
-
-    def fit_exp(x: np.ndarray, a: float, b: float) -> np.ndarray:
-        with np.errstate(over="ignore"):
-            return a * np.exp(-b * x)
-
     binsize = 1000
     decay_res = []
     for locus in locus_set.loci:
-        ldmap = locus.ld.map.copy()
-        r = locus.ld.r.copy()
-        distance_mat = np.array(
-            [ldmap["BP"] - ldmap["BP"].values[i] for i in range(len(ldmap))]
+        bp = locus.ld.map["BP"].to_numpy().astype(np.int64)
+        bins = np.arange(0, bp.max() - bp.min() + binsize, binsize)
+        r2_avg, decay_rate = _ld_decay_core(
+            bp, locus.ld.r, len(bins) - 1, binsize
         )
-        distance_mat = distance_mat[np.tril_indices_from(distance_mat, k=-1)].flatten()
-        distance_mat = np.abs(distance_mat)
-        r = r[np.tril_indices_from(r, k=-1)].flatten()
-        r = np.square(r)
-        bins = np.arange(0, ldmap["BP"].max() - ldmap["BP"].min() + binsize, binsize)
-
-        r_sum, _ = np.histogram(distance_mat, bins=bins, weights=r)
-        count, _ = np.histogram(distance_mat, bins=bins)
-
-        with np.errstate(divide="ignore", invalid="ignore"):
-            r2_avg = np.where(count > 0, r_sum / count, 0)
-        popt, _ = curve_fit(fit_exp, bins[1:] / binsize, r2_avg)
         res = pd.DataFrame(
             {
                 "distance_kb": bins[1:] / binsize,
                 "r2_avg": r2_avg,
-                "decay_rate": popt[0],
+                "decay_rate": decay_rate,
                 "cohort": f"{locus.popu}_{locus.cohort}",
             }
         )
@@ -665,37 +1069,41 @@ def cochran_q(locus_set: LocusSet) -> pd.DataFrame:
     - Batch effects
     - Population stratification
     """
-    merged_df = locus_set.loci[0].original_sumstats[[ColName.SNPID]].copy()
-    for i, locus_obj in enumerate(locus_set.loci):
-        locus_df = locus_obj.sumstats[
-            [ColName.SNPID, ColName.BETA, ColName.SE, ColName.EAF]
-        ].copy()
-        locus_df.rename(
-            columns={
-                ColName.BETA: f"BETA_{i}",
-                ColName.SE: f"SE_{i}",
-                ColName.EAF: f"EAF_{i}",
-            },
-            inplace=True,
-        )
-        merged_df = pd.merge(
-            merged_df, locus_df, on=ColName.SNPID, how="inner", suffixes=("", f"_{i}")
-        )
+    # one long frame + pivot replaces the k-way merge chain; dropping rows
+    # with missing cohorts keeps the inner-join semantics
+    long_df = pd.concat(
+        [
+            locus_obj.sumstats[[ColName.SNPID, ColName.BETA, ColName.SE]].assign(
+                cohort=i
+            )
+            for i, locus_obj in enumerate(locus_set.loci)
+        ],
+        axis=0,
+    )
+    wide_beta = long_df.pivot(
+        index=ColName.SNPID, columns="cohort", values=ColName.BETA
+    )
+    wide_se = long_df.pivot(index=ColName.SNPID, columns="cohort", values=ColName.SE)
+    keep = wide_beta.notna().all(axis=1)
+    # pivot sorts SNPID lexicographically; restore the first cohort's
+    # genomic order, which the merge chain preserved and which downstream
+    # index=False output relies on
+    first_order = locus_set.loci[0].sumstats[ColName.SNPID]
+    row_order = first_order[first_order.isin(wide_beta.index[keep])]
+    wide_beta = wide_beta.loc[row_order]
+    wide_se = wide_se.loc[row_order]
 
     k: int = len(locus_set.loci)
-    weights = []
-    effects = []
-    for i in range(k):
-        weights.append((1 / (merged_df[f"SE_{i}"] ** 2)))
-        effects.append(merged_df[f"BETA_{i}"])
+    betas = wide_beta.to_numpy().T
+    ses = wide_se.to_numpy().T
+    weights = 1.0 / (ses * ses)
 
     # Calculate weighted mean effect size
-    weighted_mean = np.sum([w * e for w, e in zip(weights, effects)], axis=0) / np.sum(
-        weights, axis=0
-    )
+    weighted_mean = (weights * betas).sum(axis=0) / weights.sum(axis=0)
 
     # Calculate Q statistic
-    Q = np.sum([w * (e - weighted_mean) ** 2 for w, e in zip(weights, effects)], axis=0)
+    diff = betas - weighted_mean
+    Q = (weights * diff * diff).sum(axis=0)
 
     # Calculate degrees of freedom
     df = k - 1
@@ -710,7 +1118,7 @@ def cochran_q(locus_set: LocusSet) -> pd.DataFrame:
     # Create output dataframe
     output_df = pd.DataFrame(
         {
-            "SNPID": merged_df["SNPID"],
+            "SNPID": wide_beta.index.to_numpy(),
             "Q": Q,
             "Q_pvalue": p_value,
             "I_squared": I_squared,
@@ -771,24 +1179,51 @@ def locus_qc(
 
     If out_dir is provided, results are saved as tab-separated files.
     """
-    qc_metrics = {}
-    all_expected_z = []
-    all_dentist_s = []
-    all_compare_maf = []
-    for locus in locus_set.loci:
-        lo = intersect_sumstat_ld(locus)
-        eigens = get_eigen(lo.ld.r)
-        lambda_s = estimate_s_rss(locus, r_tol, method, eigens)
-        expected_z = kriging_rss(locus, r_tol, lambda_s, eigens)
+    def _qc_one_locus(
+        locus: Locus, prepared: _PreparedLocus, lambda_s: float
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        expected_z = kriging_rss(locus, r_tol, lambda_s, prepared=prepared)
         expected_z["lambda_s"] = lambda_s
         expected_z["cohort"] = f"{locus.popu}_{locus.cohort}"
-        dentist_s = compute_dentist_s(locus)
+        dentist_s = compute_dentist_s(locus, prepared=prepared)
         dentist_s["cohort"] = f"{locus.popu}_{locus.cohort}"
-        compare_maf_res = compare_maf(locus)
+        compare_maf_res = compare_maf(locus, prepared=prepared)
         compare_maf_res["cohort"] = f"{locus.popu}_{locus.cohort}"
-        all_expected_z.append(expected_z)
-        all_dentist_s.append(dentist_s)
-        all_compare_maf.append(compare_maf_res)
+        return expected_z, dentist_s, compare_maf_res
+
+    qc_metrics = {}
+    loci = locus_set.loci
+    n_jobs = min(len(loci), os.cpu_count() or 1)
+    if len(loci) == 1:
+        prepared_list = [_prepare_locus(loci[0])]
+    else:
+        # limit BLAS threading inside each locus to avoid oversubscription
+        # while loci run concurrently; the LAPACK calls release the GIL
+        with threadpool_limits(limits=1):
+            prepared_list = Parallel(n_jobs=n_jobs, prefer="threads")(
+                delayed(_prepare_locus)(locus) for locus in loci
+            )
+
+    # estimate s for all loci in one vectorized pass where possible
+    if method == "null-mle":
+        lambdas = _estimate_s_rss_batch(loci, prepared_list, r_tol)
+    else:
+        lambdas = [
+            estimate_s_rss(locus, r_tol, method, prepared=prepared)
+            for locus, prepared in zip(loci, prepared_list)
+        ]
+
+    if len(loci) == 1:
+        results = [_qc_one_locus(loci[0], prepared_list[0], lambdas[0])]
+    else:
+        with threadpool_limits(limits=1):
+            results = Parallel(n_jobs=n_jobs, prefer="threads")(
+                delayed(_qc_one_locus)(locus, prepared, lambda_s)
+                for locus, prepared, lambda_s in zip(loci, prepared_list, lambdas)
+            )
+    all_expected_z = [res[0] for res in results]
+    all_dentist_s = [res[1] for res in results]
+    all_compare_maf = [res[2] for res in results]
     all_expected_z = pd.concat(all_expected_z, axis=0)
     all_dentist_s = pd.concat(all_dentist_s, axis=0)
     all_compare_maf = pd.concat(all_compare_maf, axis=0)
@@ -920,7 +1355,9 @@ def loci_qc(inputs: str, out_dir: str, threads: int = 1) -> None:
     with progress:
         task = progress.add_task("[cyan]Processing loci...", total=len(locus_groups))
 
-        # Process loci in parallel with progress updates
-        with Pool(threads) as pool:
-            for _ in pool.imap_unordered(qc_locus_cli, locus_groups):  # type: ignore
+        # Process loci in parallel with progress updates; chunking amortizes
+        # the per-task pickling and IPC cost across many small loci
+        chunksize = max(1, len(locus_groups) // (4 * threads))
+        with ProcessPoolExecutor(max_workers=threads) as executor:
+            for _ in executor.map(qc_locus_cli, locus_groups, chunksize=chunksize):
                 progress.update(task, advance=1)
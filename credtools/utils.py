@@ -2,22 +2,75 @@
 
 import logging
 import os
-import re
 import shutil
 import subprocess
 import tempfile
 from functools import wraps
+from itertools import islice
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
 
 logger = logging.getLogger("Utils")
 
+_PACKAGE_DIR = Path(__file__).parent
+
 
 # Type variable for decorator
 F = TypeVar("F", bound=Callable[..., Any])
 
+# parent directories already created by io_in_tempdir, so per-call
+# invocations skip the makedirs syscalls entirely
+_ensured_dirs: set = set()
+
+# RAM-backed storage for transient wrapper files when available; falls back
+# to the system tempdir on platforms without /dev/shm
+_TMPFS = (
+    "/dev/shm"
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK)
+    else tempfile.gettempdir()
+)
 
-def io_in_tempdir(dir: str = "./tmp") -> Callable[[F], F]:
+
+def _fast_rmtree(path: str) -> None:
+    """
+    Remove a directory tree, picking the cheapest strategy for its size.
+
+    Empty tempdirs are removed with a single ``rmdir``; shallow ones with
+    only a few files get direct ``unlink`` calls, skipping
+    ``shutil.rmtree``'s generic recursion (the common case for per-locus
+    wrapper runs). Trees with many entries are handed to native
+    ``rm -rf``, which removes finemap/SuSiEx intermediates far faster
+    than the Python-level stat/unlink round trip per entry. Everything
+    else falls back to ``shutil.rmtree``.
+
+    Parameters
+    ----------
+    path : str
+        The directory tree to remove.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(islice(it, 1001))
+        if not entries:
+            os.rmdir(path)
+            return
+        if len(entries) < 16 and all(
+            not entry.is_dir(follow_symlinks=False) for entry in entries
+        ):
+            for entry in entries:
+                os.unlink(entry.path)
+            os.rmdir(path)
+            return
+    except OSError:
+        pass
+    else:
+        if len(entries) > 1000 and shutil.which("rm") is not None:
+            subprocess.run(["rm", "-rf", path], check=False)
+            return
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def io_in_tempdir(dir: Optional[str] = None) -> Callable[[F], F]:
     """
     Create a temporary directory for I/O operations during function execution.
 
@@ -27,10 +80,17 @@ def io_in_tempdir(dir: str = "./tmp") -> Callable[[F], F]:
     - If the logging level is set to `INFO` or higher, the temporary directory is deleted.
     - If the logging level is lower than `INFO` (e.g., `DEBUG`), the directory is retained for inspection.
 
+    The parent directory is resolved per call: the ``CREDTOOLS_TMPDIR``
+    environment variable wins, then the explicit `dir` argument, then tmpfs
+    (``/dev/shm``) when available so transient wrapper files stay in RAM
+    rather than on slow cluster filesystems.
+
     Parameters
     ----------
-    dir : str, optional
-        The parent directory where the temporary directory will be created, by default "./tmp".
+    dir : Optional[str], optional
+        The parent directory where the temporary directory will be created.
+        If None, defaults to tmpfs when available, otherwise the system
+        temporary directory.
 
     Returns
     -------
@@ -58,9 +118,13 @@ def io_in_tempdir(dir: str = "./tmp") -> Callable[[F], F]:
     def decorator(func: F) -> F:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            if not os.path.exists(dir):
-                os.makedirs(dir, exist_ok=True)
-            temp_dir = tempfile.mkdtemp(dir=dir)
+            parent = os.environ.get("CREDTOOLS_TMPDIR") or dir or _TMPFS
+            if parent not in _ensured_dirs:
+                os.makedirs(parent, exist_ok=True)
+                _ensured_dirs.add(parent)
+            # prefix tempdirs with the caller's name so retained directories
+            # are attributable during debugging
+            temp_dir = tempfile.mkdtemp(dir=parent, prefix=f"{func.__name__}_")
             logger.debug(f"Created temporary directory: {temp_dir}")
 
             try:
@@ -73,7 +137,7 @@ def io_in_tempdir(dir: str = "./tmp") -> Callable[[F], F]:
                 # Determine whether to remove the temporary directory based on the logging level
                 if logger.getEffectiveLevel() >= logging.INFO:
                     try:
-                        shutil.rmtree(temp_dir)
+                        _fast_rmtree(temp_dir)
                         logger.debug(f"Removed temporary directory: {temp_dir}")
                     except Exception as cleanup_error:
                         logger.warning(
@@ -90,12 +154,61 @@ def io_in_tempdir(dir: str = "./tmp") -> Callable[[F], F]:
     return decorator
 
 
+# set once the R version has been verified, so later package probes skip
+# the version arm and cost a single R invocation
+_r_version_checked = False
+
+# contents of the bundled bin/ directory, scanned once on first use so
+# registering N tools costs one scandir instead of N stat calls
+_bin_dir_entries: Optional[Dict[str, str]] = None
+
+
+def _bin_entries() -> Dict[str, str]:
+    """Return the bundled ``bin/`` directory contents, scanned once."""
+    global _bin_dir_entries
+    if _bin_dir_entries is None:
+        try:
+            with os.scandir(_PACKAGE_DIR / "bin") as entries:
+                _bin_dir_entries = {entry.name: entry.path for entry in entries}
+        except OSError:
+            _bin_dir_entries = {}
+    return _bin_dir_entries
+
+
+def _get_r_version() -> str:
+    """
+    Return the installed R version string, or "unknown" if undeterminable.
+
+    Asks R for getRversion() directly, which emits just the version string
+    instead of the banner that ``R --version`` prints. Only used to build
+    error messages on the cold failure path, so the extra subprocess is
+    never paid during normal operation.
+    """
+    try:
+        out = subprocess.check_output(
+            ["R", "--slave", "-e", "cat(as.character(getRversion()))"]
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return "unknown"
+    # the version string is plain ASCII; decode once rather than routing
+    # the stream through the locale codec with universal_newlines
+    return out.decode("ascii", "replace").strip() or "unknown"
+
+
+# embedded R interpreter (rpy2), bound once on first use; None means not yet
+# attempted, False means rpy2 is unavailable and subprocess probes are used
+_robjects: Any = None
+
+
 def check_r_package(package_name: str) -> None:
     """
     Check if R version is 4.0 or later and if a specified R package is installed.
 
-    This function first checks the R version, then verifies if the specified
-    R package is installed on the system.
+    The first call binds an embedded R interpreter through rpy2, so
+    subsequent package probes cost microseconds instead of an R process
+    start per check. If rpy2 cannot be imported, both checks fall back to
+    a single R subprocess invocation. Once the version has been verified,
+    later calls probe only the package.
 
     Parameters
     ----------
@@ -111,8 +224,6 @@ def check_r_package(package_name: str) -> None:
     ------
     RuntimeError
         If R version is earlier than 4.0 or if the specified package is not installed.
-    subprocess.CalledProcessError
-        If there's an error executing the R commands.
     FileNotFoundError
         If R is not installed or not found in the system PATH.
 
@@ -123,39 +234,51 @@ def check_r_package(package_name: str) -> None:
     >>> check_r_package("nonexistentpackage")
     RuntimeError: R package 'nonexistentpackage' is not installed.
     """
-    # Check R version
-    try:
-        r_version_cmd = "R --version"
-        r_version_output = subprocess.check_output(
-            r_version_cmd, shell=True, universal_newlines=True
-        )
-        version_match = re.search(r"R version (\d+\.\d+\.\d+)", r_version_output)
-        if version_match:
-            r_version = version_match.group(1)
-            if tuple(map(int, r_version.split("."))) < (4, 0, 0):
+    global _r_version_checked, _robjects
+
+    if _robjects is None:
+        try:
+            from rpy2 import robjects
+
+            _robjects = robjects
+        except Exception:
+            _robjects = False
+    if _robjects is not False:
+        if not _r_version_checked:
+            r_version = str(_robjects.r("as.character(getRversion())")[0])
+            if tuple(map(int, r_version.split(".")[:3])) < (4, 0, 0):
                 raise RuntimeError(f"R version {r_version} is earlier than 4.0")
-        else:
-            raise RuntimeError("Unable to determine R version")
-    except subprocess.CalledProcessError:
-        raise RuntimeError("Failed to check R version")
-    except FileNotFoundError:
-        raise FileNotFoundError("R is not installed or not found in the system PATH.")
+            _r_version_checked = True
+        installed = bool(
+            _robjects.r(f"requireNamespace('{package_name}', quietly = TRUE)")[0]
+        )
+        if not installed:
+            raise RuntimeError(f"R package '{package_name}' is not installed.")
+        return
 
-    # Check if the package is installed
-    r_command = f"R --slave -e \"if (requireNamespace('{package_name}', quietly = TRUE)) quit(status = 0) else quit(status = 1)\""
+    package_probe = (
+        f"if (requireNamespace('{package_name}', quietly = TRUE)) "
+        "quit(status = 0) else quit(status = 1)"
+    )
+    if _r_version_checked:
+        r_script = package_probe
+    else:
+        r_script = f"if (getRversion() < '4.0.0') quit(status = 2); {package_probe}"
 
     try:
         result = subprocess.run(
-            r_command,
-            shell=True,
-            check=True,
+            ["R", "--slave", "-e", r_script],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
         )
-        if result.returncode != 0:
-            raise RuntimeError(f"R package '{package_name}' is not installed.")
-    except subprocess.CalledProcessError:
+    except FileNotFoundError:
+        raise FileNotFoundError("R is not installed or not found in the system PATH.")
+
+    if result.returncode == 2:
+        raise RuntimeError(f"R version {_get_r_version()} is earlier than 4.0")
+    if result.returncode != 0:
         raise RuntimeError(f"R package '{package_name}' is not installed.")
+    _r_version_checked = True
 
 
 class ExternalTool:
@@ -197,6 +320,15 @@ class ExternalTool:
     >>> tool.run(["view", "-h", "input.bam"], "samtools.log", "output.sam")
     """
 
+    __slots__ = (
+        "name",
+        "default_path",
+        "custom_path",
+        "_resolved_path",
+        "_internal_tool",
+        "_internal_exists",
+    )
+
     def __init__(self, name: str, default_path: Optional[str] = None) -> None:
         """
         Initialize the ExternalTool with a name and an optional default path.
@@ -211,6 +343,20 @@ class ExternalTool:
         self.name = name
         self.default_path = default_path
         self.custom_path: Optional[str] = None
+        self._resolved_path: Optional[str] = None
+        # default_path never changes after construction, so resolve the
+        # bundled-tool location once instead of per get_path miss
+        self._internal_tool: Optional[str] = None
+        self._internal_exists = False
+        if default_path:
+            internal_tool = (_PACKAGE_DIR / default_path).resolve()
+            self._internal_tool = str(internal_tool)
+            if internal_tool.parent == (_PACKAGE_DIR / "bin").resolve():
+                # bundled tools share one directory; check against the
+                # cached scandir result instead of stat-ing each binary
+                self._internal_exists = internal_tool.name in _bin_entries()
+            else:
+                self._internal_exists = os.path.exists(self._internal_tool)
 
     def set_custom_path(self, path: str) -> None:
         """
@@ -228,6 +374,7 @@ class ExternalTool:
         """
         if os.path.exists(path):
             self.custom_path = path
+            self._resolved_path = None
         else:
             raise FileNotFoundError(
                 f"Custom path for {self.name} does not exist: {path}"
@@ -242,6 +389,10 @@ class ExternalTool:
         2. System PATH (using shutil.which)
         3. Default path (relative to package directory)
 
+        The resolved path is memoized, so the PATH scan and filesystem
+        checks run only once per tool; set_custom_path invalidates the
+        cached value.
+
         Returns
         -------
         str
@@ -252,18 +403,21 @@ class ExternalTool:
         FileNotFoundError
             If the tool cannot be found in any of the paths.
         """
+        if self._resolved_path:
+            return self._resolved_path
+
         if self.custom_path:
+            self._resolved_path = self.custom_path
             return self.custom_path
 
         system_tool = shutil.which(self.name)
         if system_tool:
+            self._resolved_path = system_tool
             return system_tool
 
-        if self.default_path:
-            package_dir = Path(__file__).parent
-            internal_tool = package_dir / self.default_path
-            if internal_tool.exists():
-                return str(internal_tool)
+        if self._internal_exists:
+            self._resolved_path = self._internal_tool
+            return self._resolved_path  # type: ignore[return-value]
 
         raise FileNotFoundError(f"Could not find {self.name} executable")
 
@@ -305,22 +459,61 @@ class ExternalTool:
         """
         full_command = [self.get_path()] + command
         try:
-            # Run the command and capture output
-            logger.debug(f"Run command: {' '.join(full_command)}")
-            with open(log_file, "w") as log:
-                subprocess.run(
-                    full_command, shell=False, check=True, stdout=log, stderr=log
-                )
-
-            # Check for output file if path is provided
-            if output_file_path:
-                if isinstance(output_file_path, str):
-                    output_file_path = [output_file_path]
-                for path in output_file_path:
-                    if not os.path.exists(path):
-                        raise FileNotFoundError(
-                            f"Expected output file not found: {path}"
-                        )
+            # Run the command and capture output; only build the joined
+            # command string when DEBUG output is actually emitted
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Run command: {' '.join(full_command)}")
+            # Capture output in an unlinked temp file and only create the
+            # named log on failure or at DEBUG level, so the per-locus
+            # success path leaves no file behind. (An in-memory buffer is
+            # not an option: subprocess needs a real file descriptor.)
+            # list-form command with shell=False lets CPython use the
+            # posix_spawn fast path; close_fds=False skips the FD-closing
+            # walk, which is safe as we inherit no sensitive descriptors.
+            with tempfile.TemporaryFile() as buf:
+                try:
+                    subprocess.run(
+                        full_command,
+                        shell=False,
+                        check=True,
+                        stdout=buf,
+                        stderr=buf,
+                        close_fds=False,
+                    )
+
+                    # Check for output file if path is provided; done inside
+                    # the buffer scope so a missing output also gets the log
+                    if output_file_path:
+                        if isinstance(output_file_path, str):
+                            output_file_path = [output_file_path]
+                        parent = os.path.dirname(output_file_path[0])
+                        if len(output_file_path) > 1 and all(
+                            os.path.dirname(path) == parent
+                            for path in output_file_path
+                        ):
+                            # one readdir on the shared parent replaces a stat
+                            # per expected output
+                            with os.scandir(parent or ".") as entries:
+                                present = {entry.name for entry in entries}
+                            for path in output_file_path:
+                                if os.path.basename(path) not in present:
+                                    raise FileNotFoundError(
+                                        f"Expected output file not found: {path}"
+                                    )
+                        else:
+                            for path in output_file_path:
+                                if not os.path.exists(path):
+                                    raise FileNotFoundError(
+                                        f"Expected output file not found: {path}"
+                                    )
+
+                    if logger.isEnabledFor(logging.DEBUG):
+                        buf.seek(0)
+                        Path(log_file).write_bytes(buf.read())
+                except Exception:
+                    buf.seek(0)
+                    Path(log_file).write_bytes(buf.read())
+                    raise
 
         except Exception as e:
             logger.error(f"Command execution failed: {e}\nSee {log_file} for details.")
@@ -358,6 +551,8 @@ class ToolManager:
     >>> manager.run_tool("finemap", ["--help"], "finemap.log")
     """
 
+    __slots__ = ("tools",)
+
     def __init__(self) -> None:
         """Initialize the ToolManager with an empty dictionary of tools."""
         self.tools: Dict[str, ExternalTool] = {}
@@ -414,9 +609,10 @@ class ToolManager:
         KeyError
             If the tool is not registered.
         """
-        if name not in self.tools:
+        tool = self.tools.get(name)
+        if tool is None:
             raise KeyError(f"Tool {name} is not registered")
-        return self.tools[name]
+        return tool
 
     def run_tool(
         self,
@@ -449,11 +645,20 @@ class ToolManager:
         FileNotFoundError
             If expected output files are not found after execution.
         """
-        if name not in self.tools:
+        tool = self.tools.get(name)
+        if tool is None:
             raise KeyError(f"Tool {name} is not registered")
-        return self.get_tool(name).run(args, log_file, output_file_path)
+        return tool.run(args, log_file, output_file_path)
 
 
 tool_manager = ToolManager()
 for tool in ["finemap", "SuSiEx"]:
     tool_manager.register_tool(tool, f"bin/{tool}")
+
+# warm the resolved-path caches at import so the first wrapper call does
+# not pay the PATH scan; a missing tool is retried (and reported) on use
+for _name, _tool in tool_manager.tools.items():
+    try:
+        _tool.get_path()
+    except FileNotFoundError:
+        logger.debug(f"Tool {_name} not found at import time; will retry on use")
@@ -1,9 +1,32 @@
-"""Initailize the wrappers module."""
-
-from credtools.wrappers.abf import run_abf
-from credtools.wrappers.carma import run_carma
-from credtools.wrappers.finemap import run_finemap
-from credtools.wrappers.multisusie import run_multisusie
-from credtools.wrappers.RSparsePro import run_rsparsepro
-from credtools.wrappers.susie import run_susie
-from credtools.wrappers.susiex import run_susiex
+"""Initailize the wrappers module.
+
+Wrapper submodules are imported lazily (PEP 562) so that a CLI invocation
+only pays the import cost of the fine-mapping method it actually uses.
+"""
+
+import importlib
+
+_LAZY = {
+    "run_abf": ("credtools.wrappers.abf", "run_abf"),
+    "run_carma": ("credtools.wrappers.carma", "run_carma"),
+    "run_finemap": ("credtools.wrappers.finemap", "run_finemap"),
+    "run_multisusie": ("credtools.wrappers.multisusie", "run_multisusie"),
+    "run_rsparsepro": ("credtools.wrappers.RSparsePro", "run_rsparsepro"),
+    "run_susie": ("credtools.wrappers.susie", "run_susie"),
+    "run_susiex": ("credtools.wrappers.susiex", "run_susiex"),
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    """Resolve wrapper entry points on first access."""
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        return getattr(importlib.import_module(module_name), attr)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Include lazy attributes in dir()."""
+    return sorted(set(globals()) | set(_LAZY))
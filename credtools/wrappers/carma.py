@@ -19,7 +19,7 @@ from credtools.utils import check_r_package, io_in_tempdir
 logger = logging.getLogger("CARMA")
 
 
-@io_in_tempdir("./tmp/CARMA")
+@io_in_tempdir()
 def run_carma(
     locus: Locus,
     max_causal: int = 1,
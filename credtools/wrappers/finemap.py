@@ -16,7 +16,7 @@ from credtools.utils import io_in_tempdir, tool_manager
 logger = logging.getLogger("FINEMAP")
 
 
-@io_in_tempdir("./tmp/FINEMAP")
+@io_in_tempdir()
 def run_finemap(
     locus: Locus,
     max_causal: int = 1,
@@ -16,7 +16,7 @@ from credtools.utils import io_in_tempdir, tool_manager
 logger = logging.getLogger("SuSiEx")
 
 
-@io_in_tempdir("./tmp/SuSiEx")
+@io_in_tempdir()
 def run_susiex(
     locus_set: LocusSet,
     max_causal: int = 1,
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""Tests for the numeric kernels in `credtools.qc`."""
+
+import numpy as np
+from numpy.testing import assert_allclose
+from scipy.optimize import curve_fit
+from scipy.special import logsumexp
+
+from credtools.qc import _fit_mixture_weights, _ld_decay_core
+
+
+def _make_decay_ld(seed: int, a: float, b: float, p: int = 80, binsize: int = 1000):
+    """Build positions and an LD matrix following r^2 = a * exp(-b * x)."""
+    rng = np.random.default_rng(seed)
+    bp = np.sort(rng.choice(np.arange(1, 60_000), size=p, replace=False)).astype(
+        np.int64
+    )
+    r = np.eye(p)
+    for i in range(1, p):
+        for j in range(i):
+            d = abs(bp[i] - bp[j])
+            x = min(d // binsize, (bp.max() - bp.min()) // binsize) + 1
+            r2 = a * np.exp(-b * x) + rng.normal(0, 1e-4)
+            r[i, j] = r[j, i] = np.sqrt(max(r2, 0.0))
+    return bp, r
+
+
+def test_ld_decay_core_matches_curve_fit():
+    """Fitted amplitude agrees with scipy.optimize.curve_fit."""
+    binsize = 1000
+    for seed, a, b in [(0, 0.9, 0.05), (1, 0.8, 0.5), (7, 0.7, 1.5)]:
+        bp, r = _make_decay_ld(seed, a, b, binsize=binsize)
+        bins = np.arange(0, bp.max() - bp.min() + binsize, binsize)
+        nbins = len(bins) - 1
+
+        r2_avg, amplitude = _ld_decay_core(bp, r, nbins, binsize)
+
+        # reference: the binned averages ld_decay used to build with
+        # np.histogram, fitted with curve_fit as in the baseline
+        dist = np.abs(bp[:, None] - bp[None, :])[np.tril_indices(len(bp), k=-1)]
+        r2 = (r**2)[np.tril_indices(len(bp), k=-1)]
+        bin_idx = np.minimum(dist // binsize, nbins - 1)
+        expected_avg = np.zeros(nbins)
+        for k in range(nbins):
+            if np.any(bin_idx == k):
+                expected_avg[k] = r2[bin_idx == k].mean()
+        assert_allclose(r2_avg, expected_avg, rtol=1e-10)
+
+        popt, _ = curve_fit(
+            lambda x, a_, b_: a_ * np.exp(-b_ * x),
+            np.arange(1, nbins + 1),
+            expected_avg,
+        )
+        assert_allclose(amplitude, popt[0], rtol=1e-5)
+
+
+def test_fit_mixture_weights_matches_reference_em():
+    """Weight-only EM agrees with a vectorized NumPy reference."""
+    rng = np.random.default_rng(42)
+    n, k = 500, 4
+    # per-component log-densities of draws from a mixture of normals
+    z = np.concatenate(
+        [rng.normal(0, sd, size=n // k) for sd in (0.5, 1.0, 2.0, 4.0)]
+    )
+    sds = np.array([0.5, 1.0, 2.0, 4.0])
+    log_lik = (
+        -0.5 * (z[:, None] / sds) ** 2 - np.log(sds) - 0.5 * np.log(2 * np.pi)
+    )
+
+    w = _fit_mixture_weights(np.ascontiguousarray(log_lik))
+
+    # reference EM with the same uniform init and update rule
+    w_ref = np.full(k, 1.0 / k)
+    for _ in range(1000):
+        weighted = log_lik + np.log(w_ref + 1e-15)
+        resp = np.exp(weighted - logsumexp(weighted, axis=1, keepdims=True))
+        w_new = resp.mean(axis=0)
+        if np.max(np.abs(w_new - w_ref)) < 1e-6:
+            w_ref = w_new
+            break
+        w_ref = w_new
+
+    assert_allclose(w, w_ref, atol=1e-6)
+    assert_allclose(w.sum(), 1.0, atol=1e-12)